@@ -1,14 +1,35 @@
 from __future__ import annotations
 
+import hashlib
 import io
+import mmap
+import multiprocessing
 import os
+import struct
 import sys
+import threading
+import zlib
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from functools import lru_cache
 from typing import List, Optional, Tuple
 
-from PyQt6.QtCore import Qt, QSize, QUrl
-from PyQt6.QtGui import QIcon, QPixmap, QImageReader
+from PyQt6.QtCore import (
+    Qt,
+    QAbstractListModel,
+    QEvent,
+    QMimeData,
+    QModelIndex,
+    QObject,
+    QRect,
+    QRunnable,
+    QSize,
+    QStandardPaths,
+    QThreadPool,
+    QUrl,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QImage, QImageIOHandler, QPixmap, QPixmapCache, QImageReader
 from PyQt6.QtWidgets import (
     QApplication,
     QMainWindow,
@@ -16,28 +37,45 @@ from PyQt6.QtWidgets import (
     QVBoxLayout,
     QHBoxLayout,
     QPushButton,
-    QLabel,
-    QListWidget,
     QListView,
-    QListWidgetItem,
     QFileDialog,
     QMessageBox,
     QStyle,
     QStatusBar,
+    QStyledItemDelegate,
 )
 
 from PIL import Image
-from PIL.ImageQt import ImageQt
 
 import pypdf
+from pypdf.generic import DictionaryObject, NameObject, NumberObject, StreamObject
 import pypdfium2 as pdfium
 
 
 SUPPORTED_IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".bmp", ".tif", ".tiff", ".webp"}
 PDF_EXTS = {".pdf"}
+_ALL_EXTS = frozenset(sys.intern(e) for e in SUPPORTED_IMAGE_EXTS | PDF_EXTS)
+
+
+def _ext(path: str) -> str:
+    """Lowercased extension including the dot, without splitext's tuple
+    allocation; '' when there is no dot."""
+    i = path.rfind(".")
+    return path[i:].lower() if i >= 0 else ""
 
 THUMB_MAX_SIZE = QSize(180, 240)
 
+# Minimum pages a PDF thumbnail shard should own; below this, the cost of
+# another process-pool task (and its own document open) outweighs the
+# parallelism.
+MIN_PAGES_PER_WORKER = 8
+
+# PDFium is inherently not thread-safe: concurrent calls are forbidden even
+# against different documents, so every pdfium entry point (open, render,
+# close) serializes on this lock. Reentrant because the generic render path
+# opens a document and then renders through _render_pdf_page.
+_PDFIUM_LOCK = threading.RLock()
+
 
 @dataclass(frozen=True)
 class PageData:
@@ -53,38 +91,220 @@ class PageData:
         return base
 
 
-class ThumbListWidget(QListWidget):
+class PageListModel(QAbstractListModel):
+    """Backs the page grid: one PageData plus its thumbnail pixmap per row.
+
+    Rows are plain model entries (no child widgets), so per-page cost is
+    one pixmap and a dataclass, and the view can lay out thousands of
+    rows without per-item layout passes.
+    """
+
+    _MIME_TYPE = "application/x-pdfcombiner-rows"
+
+    def __init__(self, parent: QObject | None = None):
+        super().__init__(parent)
+        self._pages: List[PageData] = []
+        self._pixmaps: List[QPixmap] = []
+        # PageData -> rows lookup for set_pixmap; rebuilt lazily after any
+        # structural change rather than scanning _pages per thumbnail.
+        self._row_index: Optional[dict[PageData, List[int]]] = None
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._pages)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not (0 <= index.row() < len(self._pages)):
+            return None
+        page_data = self._pages[index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return page_data.label
+        if role == Qt.ItemDataRole.DecorationRole:
+            return self._pixmaps[index.row()]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            return f"{page_data.label}\nPress Delete to remove"
+        if role == Qt.ItemDataRole.UserRole:
+            return page_data
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return Qt.AlignmentFlag.AlignCenter
+        return None
+
+    def flags(self, index: QModelIndex) -> Qt.ItemFlag:
+        base = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
+        if index.isValid():
+            return base | Qt.ItemFlag.ItemIsDragEnabled
+        # Drops land between rows, never on top of one
+        return base | Qt.ItemFlag.ItemIsDropEnabled
+
+    def supportedDropActions(self) -> Qt.DropAction:
+        return Qt.DropAction.MoveAction
+
+    def mimeTypes(self) -> List[str]:
+        return [self._MIME_TYPE]
+
+    def mimeData(self, indexes) -> QMimeData:
+        mime = QMimeData()
+        rows = ",".join(str(i.row()) for i in indexes if i.isValid())
+        mime.setData(self._MIME_TYPE, rows.encode("ascii"))
+        return mime
+
+    def canDropMimeData(self, data, action, row, column, parent) -> bool:
+        return action == Qt.DropAction.MoveAction and data.hasFormat(self._MIME_TYPE)
+
+    def dropMimeData(self, data, action, row, column, parent: QModelIndex) -> bool:
+        # Standard internal-move protocol: insert copies at the target,
+        # then the view removes the originals via removeRows (selection
+        # indexes shift with the insert, so the right rows go away).
+        if not self.canDropMimeData(data, action, row, column, parent):
+            return False
+        src_rows = [int(r) for r in bytes(data.data(self._MIME_TYPE)).decode("ascii").split(",") if r]
+        if not src_rows:
+            return False
+        if row == -1:
+            row = parent.row() if parent.isValid() else len(self._pages)
+        entries = [(self._pages[r], self._pixmaps[r]) for r in src_rows]
+        self.beginInsertRows(QModelIndex(), row, row + len(entries) - 1)
+        for offset, (page_data, pixmap) in enumerate(entries):
+            self._pages.insert(row + offset, page_data)
+            self._pixmaps.insert(row + offset, pixmap)
+        self._row_index = None
+        self.endInsertRows()
+        return True
+
+    def moveRows(self, source_parent: QModelIndex, source_row: int, count: int,
+                 destination_parent: QModelIndex, destination_child: int) -> bool:
+        # QListView's dropEvent drives internal drag-reorder through this
+        # (in IconMode the mime path is never consulted), so a real
+        # implementation is what makes dropping actually reorder pages.
+        if count <= 0 or source_row < 0 or source_row + count > len(self._pages):
+            return False
+        if source_row <= destination_child <= source_row + count:
+            return False  # destination inside the moved block: nothing to do
+        if not self.beginMoveRows(source_parent, source_row, source_row + count - 1,
+                                  destination_parent, destination_child):
+            return False
+        pages = self._pages[source_row:source_row + count]
+        pixmaps = self._pixmaps[source_row:source_row + count]
+        del self._pages[source_row:source_row + count]
+        del self._pixmaps[source_row:source_row + count]
+        insert_at = destination_child - count if destination_child > source_row else destination_child
+        self._pages[insert_at:insert_at] = pages
+        self._pixmaps[insert_at:insert_at] = pixmaps
+        self._row_index = None
+        self.endMoveRows()
+        return True
+
+    def removeRows(self, row: int, count: int, parent: QModelIndex = QModelIndex()) -> bool:
+        if row < 0 or count <= 0 or row + count > len(self._pages):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._pages[row:row + count]
+        del self._pixmaps[row:row + count]
+        self._row_index = None
+        self.endRemoveRows()
+        return True
+
+    # Convenience API used by MainWindow
+
+    def add_pages(self, pages: List[PageData], pixmaps: List[QPixmap]) -> None:
+        if not pages:
+            return
+        start = len(self._pages)
+        self.beginInsertRows(QModelIndex(), start, start + len(pages) - 1)
+        self._pages.extend(pages)
+        self._pixmaps.extend(pixmaps)
+        self._row_index = None
+        self.endInsertRows()
+
+    def _rows_for(self, page_data: PageData) -> List[int]:
+        if self._row_index is None:
+            index: dict[PageData, List[int]] = {}
+            for row, pd in enumerate(self._pages):
+                index.setdefault(pd, []).append(row)
+            self._row_index = index
+        return self._row_index.get(page_data, [])
+
+    def set_pixmap(self, page_data: PageData, pixmap: QPixmap) -> None:
+        for row in self._rows_for(page_data):
+            self._pixmaps[row] = pixmap
+            index = self.index(row)
+            self.dataChanged.emit(index, index, [Qt.ItemDataRole.DecorationRole])
+
+    def pages(self) -> List[PageData]:
+        return list(self._pages)
+
+
+class PageItemDelegate(QStyledItemDelegate):
+    """Prepends the 1-based row number to each label at paint time (so
+    reordering never rewrites item data) and paints a trash button in the
+    item's top-right corner; a click inside its rect removes the row."""
+
+    TRASH_SIZE = 20
+    TRASH_MARGIN = 6
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        option.text = f"{index.row() + 1}. {option.text}"
+
+    def _trash_rect(self, rect: QRect) -> QRect:
+        return QRect(
+            rect.right() - self.TRASH_SIZE - self.TRASH_MARGIN,
+            rect.top() + self.TRASH_MARGIN,
+            self.TRASH_SIZE,
+            self.TRASH_SIZE,
+        )
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        icon = QApplication.style().standardIcon(QStyle.StandardPixmap.SP_TrashIcon)
+        icon.paint(painter, self._trash_rect(option.rect))
+
+    def sizeHint(self, option, index) -> QSize:
+        return QSize(THUMB_MAX_SIZE.width() + 20, THUMB_MAX_SIZE.height() + 50)
+
+    def editorEvent(self, event, model, option, index) -> bool:
+        if (
+            event.type() == QEvent.Type.MouseButtonRelease
+            and event.button() == Qt.MouseButton.LeftButton
+            and self._trash_rect(option.rect).contains(event.position().toPoint())
+        ):
+            model.removeRows(index.row(), 1)
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class ThumbListView(QListView):
     def __init__(self, parent: QWidget | None = None):
         super().__init__(parent)
-        self.setViewMode(QListWidget.ViewMode.IconMode)
+        self.setViewMode(QListView.ViewMode.IconMode)
         self.setIconSize(THUMB_MAX_SIZE)
         self.setFlow(QListView.Flow.LeftToRight)
-        self.setResizeMode(QListWidget.ResizeMode.Adjust)
-        self.setMovement(QListWidget.Movement.Snap)  # Snap to grid positions during drag
+        self.setResizeMode(QListView.ResizeMode.Adjust)
+        self.setMovement(QListView.Movement.Snap)  # Snap to grid positions during drag
         self.setWrapping(True)
         self.setSpacing(12)
         self.setDragEnabled(True)
         self.setAcceptDrops(True)
         self.setDropIndicatorShown(True)
-        self.setDragDropMode(QListWidget.DragDropMode.InternalMove)
-        self.setSelectionMode(QListWidget.SelectionMode.SingleSelection)
+        self.setDragDropMode(QListView.DragDropMode.InternalMove)
+        self.setSelectionMode(QListView.SelectionMode.SingleSelection)
         self.setDefaultDropAction(Qt.DropAction.MoveAction)
         # Make the grid spacing uniform
         self.setUniformItemSizes(True)
-        self.setLayoutMode(QListWidget.LayoutMode.Batched)
+        self.setLayoutMode(QListView.LayoutMode.Batched)
+        self.setBatchSize(100)
         # Grid background and styling
         self.setStyleSheet("""
-            QListWidget {
+            QListView {
                 background-color: #f5f5f5;
                 border: 1px solid #ddd;
                 padding: 8px;
             }
-            QListWidget::item:selected {
+            QListView::item:selected {
                 background-color: #e3f2fd;
                 border: 2px solid #2196F3;
                 border-radius: 4px;
             }
-            QListWidget::item:hover {
+            QListView::item:hover {
                 background-color: #f0f0f0;
                 border-radius: 4px;
             }
@@ -120,24 +340,20 @@ class ThumbListWidget(QListWidget):
         
         # Internal reordering - use Qt's default handler
         super().dropEvent(event)
-        
-        # Update order labels after move completes
-        parent_window = self.parent()
-        if parent_window and hasattr(parent_window, 'refresh_order_labels'):
-            from PyQt6.QtCore import QTimer
-            QTimer.singleShot(10, parent_window.refresh_order_labels)  # type: ignore[attr-defined]
-    
+
+        # Rows below the drop point changed numbers; schedule one repaint.
+        self.viewport().update()
+
     def keyPressEvent(self, event):
         # Delete key removes selected item
         if event.key() in (Qt.Key.Key_Delete, Qt.Key.Key_Backspace):
-            current = self.currentItem()
-            if current:
-                row = self.row(current)
-                self.takeItem(row)
+            current = self.currentIndex()
+            if current.isValid():
+                self.model().removeRows(current.row(), 1)
+                self.viewport().update()
                 parent_window = self.parent()
-                if parent_window and hasattr(parent_window, 'refresh_order_labels'):
-                    parent_window.refresh_order_labels()  # type: ignore[attr-defined]
-                    parent_window.statusBar().showMessage(f"Total pages: {self.count()}")  # type: ignore[attr-defined]
+                if parent_window and hasattr(parent_window, 'statusBar'):
+                    parent_window.statusBar().showMessage(f"Total pages: {self.model().rowCount()}")  # type: ignore[attr-defined]
             event.accept()
         else:
             super().keyPressEvent(event)
@@ -145,12 +361,84 @@ class ThumbListWidget(QListWidget):
 
 
 
+class ThumbnailSignals(QObject):
+    # (page_data, image) — emitted from worker threads, delivered queued
+    finished = pyqtSignal(object, QImage)
+
+
+class ThumbnailWorker(QRunnable):
+    """Renders one page's thumbnail off the GUI thread."""
+
+    def __init__(self, page_data: PageData, signals: ThumbnailSignals):
+        super().__init__()
+        self.page_data = page_data
+        self.signals = signals
+
+    def run(self):
+        image = render_thumbnail(self.page_data)
+        self.signals.finished.emit(self.page_data, image)
+
+
+class PdfThumbnailWorker(QRunnable):
+    """Thumbnails all requested pages of one PDF shard.
+
+    Disk-cache hits are served straight from this thread. Misses are
+    rasterized as one task in the render process pool — each worker
+    process owns its pdfium state, so rendering scales across cores
+    where in-process calls would serialize on _PDFIUM_LOCK. This thread
+    then only decodes the returned WEBP bytes, stores them in the disk
+    cache, and emits the results.
+    """
+
+    def __init__(self, path: str, pages: List[PageData], signals: ThumbnailSignals):
+        super().__init__()
+        self.path = path
+        self.pages = pages
+        self.signals = signals
+
+    def run(self):
+        misses: List[Tuple[PageData, Optional[str]]] = []
+        for pd in self.pages:
+            cache_path = _thumbnail_cache_path(pd)
+            if cache_path is not None and os.path.isfile(cache_path):
+                cached = QImage(cache_path)
+                if not cached.isNull():
+                    self.signals.finished.emit(pd, cached)
+                    continue
+            misses.append((pd, cache_path))
+        if not misses:
+            return
+        indices = [pd.page_index or 0 for pd, _ in misses]
+        try:
+            encoded = _pdf_render_pool().submit(_render_pdf_pages_webp, self.path, indices).result()
+        except Exception:
+            encoded = [None] * len(misses)
+        for (pd, cache_path), data in zip(misses, encoded):
+            image = QImage.fromData(data, "WEBP") if data is not None else QImage()
+            if image.isNull():
+                self.signals.finished.emit(pd, _broken_qimage())
+                continue
+            if cache_path is not None:
+                _store_cached_thumbnail_bytes(data, cache_path)
+            self.signals.finished.emit(pd, image)
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
         self.setWindowTitle("PDF Combiner")
         self.resize(1000, 700)
         self._pdf_readers_cache: dict[str, pypdf.PdfReader] = {}
+        self._ext_handlers = {e: self._add_pdf for e in PDF_EXTS}
+        self._ext_handlers.update({e: self._add_image for e in SUPPORTED_IMAGE_EXTS})
+
+        self._thumb_pool = QThreadPool.globalInstance()
+        self._thumb_pool.setMaxThreadCount(os.cpu_count() or 1)
+        # Let Qt bound in-process thumbnail memory instead of an unbounded
+        # per-function lru_cache; the limit is in kilobytes.
+        QPixmapCache.setCacheLimit(50 * 1024)
+        self._thumb_signals = ThumbnailSignals()
+        self._thumb_signals.finished.connect(self._on_thumbnail_ready)
 
         central = QWidget(self)
         vbox = QVBoxLayout(central)
@@ -166,15 +454,14 @@ class MainWindow(QMainWindow):
         top_bar.addStretch(1)
         vbox.addLayout(top_bar)
 
-        # List of pages
-        self.list = ThumbListWidget(self)
+        # List of pages; the delegate paints order numbers and the trash
+        # button, the model holds one PageData + pixmap per row
+        self.model = PageListModel(self)
+        self.list = ThumbListView(self)
+        self.list.setModel(self.model)
+        self.list.setItemDelegate(PageItemDelegate(self.list))
         vbox.addWidget(self.list, 1)
 
-        # Update numbering on reorder/insert/remove
-        self.list.model().rowsMoved.connect(lambda *args: self.refresh_order_labels())
-        self.list.model().rowsRemoved.connect(lambda *args: self.refresh_order_labels())
-        self.list.model().rowsInserted.connect(lambda *args: self.refresh_order_labels())
-
         # Bottom bar with Combine button
         bottom_bar = QHBoxLayout()
         bottom_bar.addStretch(1)
@@ -201,52 +488,73 @@ class MainWindow(QMainWindow):
             self.add_files(files)
 
     def add_files(self, paths: List[str]):
-        for p in paths:
-            if not os.path.isfile(p):
-                continue
-            ext = os.path.splitext(p)[1].lower()
-            if ext in PDF_EXTS:
-                self._add_pdf(p)
-            elif ext in SUPPORTED_IMAGE_EXTS:
-                self._add_image(p)
-        self.refresh_order_labels()
-        self.statusBar().showMessage(f"Total pages: {self.list.count()}")
+        # Freeze painting for the duration of the bulk insert; one layout
+        # pass at the end instead of one per file. (Rows arrive in one
+        # insertRows batch per file, so model signals stay cheap.)
+        self.list.setUpdatesEnabled(False)
+        try:
+            for p in paths:
+                handler = self._ext_handlers.get(_ext(p))
+                if handler is None or not os.path.isfile(p):
+                    continue
+                handler(p)
+        finally:
+            self.list.setUpdatesEnabled(True)
+        self.statusBar().showMessage(f"Total pages: {self.model.rowCount()}")
 
     def _add_pdf(self, path: str):
         try:
-            reader = pypdf.PdfReader(path)
+            reader = self._get_reader(path)
         except Exception as e:
             QMessageBox.warning(self, "Error", f"Failed to read PDF: {os.path.basename(path)}\n{e}")
             return
         num_pages = len(reader.pages)
+        pds: List[PageData] = []
+        pixmaps: List[QPixmap] = []
+        pending: List[PageData] = []
         for i in range(num_pages):
             pd = PageData(kind="pdf", path=path, page_index=i)
-            thumb = get_thumbnail(pd)
-            self._add_page_item(pd, thumb)
+            pds.append(pd)
+            pm = QPixmapCache.find(repr(pd))
+            if pm is not None and not pm.isNull():
+                pixmaps.append(pm)
+            else:
+                pixmaps.append(_placeholder_pixmap())
+                pending.append(pd)
+        self.model.add_pages(pds, pixmaps)
+        if not pending:
+            return
+        # Shard the pages across workers; each shard's cache misses
+        # become one render-pool task with its own document handle in
+        # its own process, so shards rasterize genuinely in parallel.
+        n_shards = max(1, min(os.cpu_count() or 1, len(pending) // MIN_PAGES_PER_WORKER))
+        shard_size = -(-len(pending) // n_shards)  # ceil division
+        for start in range(0, len(pending), shard_size):
+            self._thumb_pool.start(
+                PdfThumbnailWorker(path, pending[start:start + shard_size], self._thumb_signals)
+            )
 
     def _add_image(self, path: str):
         pd = PageData(kind="img", path=path)
-        thumb = get_thumbnail(pd)
-        self._add_page_item(pd, thumb)
-
-    def _add_page_item(self, page_data: PageData, thumb: QPixmap):
-        item = QListWidgetItem()
-        # Set thumbnail as icon
-        item.setIcon(QIcon(thumb))
-        # Set filename as text (order number will be prepended in refresh_order_labels)
-        item.setText(page_data.label)
-        item.setToolTip(f"{page_data.label}\nPress Delete to remove")
-        # Size hint for the icon
-        item.setSizeHint(QSize(THUMB_MAX_SIZE.width() + 20, THUMB_MAX_SIZE.height() + 50))
-        item.setData(Qt.ItemDataRole.UserRole, page_data)
-        item.setFlags(item.flags() | Qt.ItemFlag.ItemIsSelectable | Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsDragEnabled | Qt.ItemFlag.ItemIsDropEnabled)
-        item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-        
-        self.list.addItem(item)
-        self.refresh_order_labels()
+        pm = QPixmapCache.find(repr(pd))
+        if pm is not None and not pm.isNull():
+            self.model.add_pages([pd], [pm])
+            return
+        self.model.add_pages([pd], [_placeholder_pixmap()])
+        self._request_thumbnail(pd)
+
+    def _request_thumbnail(self, page_data: PageData):
+        self._thumb_pool.start(ThumbnailWorker(page_data, self._thumb_signals))
+
+    def _on_thumbnail_ready(self, page_data: PageData, image: QImage):
+        # Rows may have moved (or been removed) since the worker started,
+        # so the model matches by PageData rather than by row.
+        pm = QPixmap.fromImage(image)
+        QPixmapCache.insert(repr(page_data), pm)
+        self.model.set_pixmap(page_data, pm)
 
     def on_combine(self):
-        if self.list.count() == 0:
+        if self.model.rowCount() == 0:
             QMessageBox.information(self, "Nothing to do", "Add some pages first.")
             return
         default_name = os.path.expanduser(os.path.join("~", "combined.pdf"))
@@ -268,111 +576,419 @@ class MainWindow(QMainWindow):
     def _write_combined_pdf(self, out_path: str):
         writer = pypdf.PdfWriter()
 
-        for i in range(self.list.count()):
-            item = self.list.item(i)
-            page_data: PageData = item.data(Qt.ItemDataRole.UserRole)
+        pages = self.model.pages()
+
+        # Run the CPU-heavy image decode/encode stage in a process pool
+        # (one task per unique path), then stitch the results into the
+        # writer in page order on this thread.
+        image_paths = list(dict.fromkeys(pd.path for pd in pages if pd.kind == "img"))
+        if len(image_paths) > 1:
+            with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(image_paths))) as pool:
+                image_data = dict(zip(image_paths, pool.map(_image_stream_data, image_paths)))
+        else:
+            image_data = {path: _image_stream_data(path) for path in image_paths}
+
+        i = 0
+        while i < len(pages):
+            page_data: PageData = pages[i]
             if page_data.kind == "pdf":
-                reader = self._get_reader(page_data.path)
-                writer.add_page(reader.pages[page_data.page_index])  # type: ignore[index]
+                # Append consecutive pages from the same source in one call
+                # so pypdf resolves that file's shared resources once.
+                indices = [page_data.page_index]
+                j = i + 1
+                while j < len(pages) and pages[j].kind == "pdf" and pages[j].path == page_data.path:
+                    indices.append(pages[j].page_index)
+                    j += 1
+                writer.append(self._get_reader(page_data.path), pages=indices, import_outline=False)
+                i = j
             else:
-                # Convert image page to a temporary in-memory one-page PDF and import
-                img_pdf_bytes = image_to_pdf_bytes(page_data.path)
-                tmp_reader = pypdf.PdfReader(io.BytesIO(img_pdf_bytes))
-                writer.add_page(tmp_reader.pages[0])
-
-        with open(out_path, "wb") as f:
-            writer.write(f)
-
-    def refresh_order_labels(self):
-        for i in range(self.list.count()):
-            item = self.list.item(i)
-            page_data = item.data(Qt.ItemDataRole.UserRole)
-            if page_data:
-                # Update text with order number
-                item.setText(f"{i + 1}. {page_data.label}")
-    
-
-    @lru_cache(maxsize=32)
+                # Embed the image directly as a page XObject (no PDF round-trip)
+                image_to_pdf_page(writer, page_data.path, image_data[page_data.path])
+                i += 1
+
+        # pypdf emits many small writes (one per object header/dict); a
+        # 1 MiB buffer batches them into few syscalls.
+        with open(out_path, "wb", buffering=0) as raw:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(raw.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            with io.BufferedWriter(raw, buffer_size=1 << 20) as f:
+                writer.write(f)
+
     def _get_reader(self, path: str) -> pypdf.PdfReader:
-        return pypdf.PdfReader(path)
+        # Session-lifetime cache so adding and combining the same file
+        # parse it once, with the xref table staying warm in between.
+        reader = self._pdf_readers_cache.get(path)
+        if reader is None:
+            # Memory-map the file so pypdf's many small seek/read pairs go
+            # through the page cache without a per-read syscall + copy.
+            # The reader holds the mmap (as its stream) for its lifetime.
+            with open(path, "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            if hasattr(mm, "madvise") and hasattr(mmap, "MADV_RANDOM"):
+                mm.madvise(mmap.MADV_RANDOM)  # pypdf seeks around the xref
+            reader = pypdf.PdfReader(mm, strict=False)
+            self._pdf_readers_cache[path] = reader
+        return reader
 
 
 def is_supported_path(path: str) -> bool:
-    ext = os.path.splitext(path)[1].lower()
-    return ext in SUPPORTED_IMAGE_EXTS or ext in PDF_EXTS
-
-
-@lru_cache(maxsize=256)
-def get_thumbnail(page_data: PageData) -> QPixmap:
+    return _ext(path) in _ALL_EXTS
+
+
+@lru_cache(maxsize=1)
+def _thumbnail_cache_dir() -> str:
+    base = QStandardPaths.writableLocation(QStandardPaths.StandardLocation.CacheLocation)
+    path = os.path.join(base, "thumbnails")
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def _thumbnail_cache_path(page_data: PageData) -> Optional[str]:
+    """On-disk cache file for a page, or None if the source is unreadable.
+
+    The key fingerprints path, mtime, size, page index and thumb size, so
+    edited files and changed settings miss cleanly.
+    """
+    try:
+        st = os.stat(page_data.path)
+    except OSError:
+        return None
+    key = (
+        f"{page_data.path}|{st.st_mtime_ns}|{st.st_size}|{page_data.page_index}"
+        f"|{THUMB_MAX_SIZE.width()}x{THUMB_MAX_SIZE.height()}"
+    )
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(_thumbnail_cache_dir(), digest + ".webp")
+
+
+def _store_cached_thumbnail(image: QImage, cache_path: str) -> None:
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        if image.save(tmp_path, "WEBP", 80):
+            os.replace(tmp_path, cache_path)
+        elif os.path.exists(tmp_path):
+            os.remove(tmp_path)
+    except OSError:
+        pass
+
+
+def _store_cached_thumbnail_bytes(data: bytes, cache_path: str) -> None:
+    """Store already-encoded WEBP bytes (e.g. from a render worker)."""
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+
+def _with_thumbnail_cache(page_data: PageData, render) -> QImage:
+    """Wrap a render callable with the disk-cache lookup/store."""
+    cache_path = _thumbnail_cache_path(page_data)
+    if cache_path is not None and os.path.isfile(cache_path):
+        cached = QImage(cache_path)
+        if not cached.isNull():
+            return cached
+    image = render()
+    if image.isNull():
+        return _broken_qimage()
+    if cache_path is not None:
+        _store_cached_thumbnail(image, cache_path)
+    return image
+
+
+def render_thumbnail(page_data: PageData) -> QImage:
+    """Render the thumbnail for one page as a QImage.
+
+    Uses only thread-safe types (QImage, PIL) so it can run on worker
+    threads; conversion to QPixmap happens on the GUI thread. Successful
+    renders are persisted to a per-user disk cache, so later sessions
+    reload them instead of re-rendering. In-process caching happens in
+    QPixmapCache on the GUI side, which Qt keeps under a byte budget.
+    """
+    return _with_thumbnail_cache(page_data, lambda: _render_thumbnail(page_data))
+
+
+@lru_cache(maxsize=1)
+def _pdf_render_pool() -> ProcessPoolExecutor:
+    # spawn, not fork: forked children would inherit Qt and pdfium state.
+    return ProcessPoolExecutor(
+        max_workers=os.cpu_count() or 1,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def _render_pdf_pages_webp(path: str, page_indices: List[int]) -> List[Optional[bytes]]:
+    """Render pages of one PDF to WEBP-encoded thumbnail bytes.
+
+    Runs in a render-pool worker process: the process owns its pdfium
+    state, so no lock is needed and documents render concurrently across
+    processes. Returning encoded bytes keeps the pipe traffic small and
+    leaves QImage assembly to the parent; pages that fail come back as
+    None.
+    """
+    try:
+        pdf = pdfium.PdfDocument(path)
+    except Exception:
+        return [None] * len(page_indices)
+    results: List[Optional[bytes]] = []
+    try:
+        for index in page_indices:
+            try:
+                page = pdf.get_page(index)
+                try:
+                    width, height = page.get_size()
+                    pil_img = page.render(scale=_thumb_scale(width, height)).to_pil()
+                finally:
+                    page.close()
+                buf = io.BytesIO()
+                pil_img.save(buf, "WEBP", quality=80)
+                results.append(buf.getvalue())
+            except Exception:
+                results.append(None)
+    finally:
+        pdf.close()
+    return results
+
+
+def _thumb_scale(width: float, height: float) -> float:
+    """Render scale for a page of the given point size: near the thumb
+    box, slightly oversampled to keep text crisp."""
+    scale = min(THUMB_MAX_SIZE.width() / max(width, 1), THUMB_MAX_SIZE.height() / max(height, 1))
+    return max(scale, 0.2) * 1.25
+
+
+# pdfium bitmap modes that a QImage can wrap without per-pixel conversion
+_PDFIUM_QIMAGE_FORMATS = {
+    "BGR": QImage.Format.Format_BGR888,
+    "BGRA": QImage.Format.Format_ARGB32,
+    "BGRX": QImage.Format.Format_RGB32,
+    "L": QImage.Format.Format_Grayscale8,
+}
+
+
+def _render_pdf_page(pdf: pdfium.PdfDocument, page_index: int) -> QImage:
+    try:
+        with _PDFIUM_LOCK:
+            page = pdf.get_page(page_index)
+            try:
+                # Render near target size and wrap the raw bitmap in a
+                # QImage — no PIL resample pass.
+                width, height = page.get_size()
+                bitmap = page.render(scale=_thumb_scale(width, height))
+                fmt = _PDFIUM_QIMAGE_FORMATS.get(bitmap.mode)
+                if fmt is None:
+                    pil_img = _prepare_image_for_thumb(bitmap.to_pil())
+                    return pil_to_qimage(pil_img)
+                arr = bitmap.to_numpy()
+                h, w = arr.shape[:2]
+                return QImage(arr.data, w, h, arr.strides[0], fmt).copy()
+            finally:
+                page.close()
+    except Exception:
+        return QImage()
+
+
+def _render_thumbnail(page_data: PageData) -> QImage:
     if page_data.kind == "img":
-        # Prefer QImageReader with auto orientation and color profile handling.
+        # Prefer QImageReader with auto orientation and color profile
+        # handling. Asking the reader for a scaled read up front lets
+        # libjpeg-turbo decode at a reduced DCT scale instead of decoding
+        # full resolution and shrinking afterwards.
         try:
             reader = QImageReader(page_data.path)
             reader.setAutoTransform(True)
+            size = reader.size()
+            if size.isValid():
+                box = THUMB_MAX_SIZE
+                if reader.transformation() & QImageIOHandler.Transformation.TransformationRotate90:
+                    # Scaling applies before the EXIF rotation
+                    box = QSize(box.height(), box.width())
+                reader.setScaledSize(size.scaled(box, Qt.AspectRatioMode.KeepAspectRatio))
             qimg = reader.read()
             if not qimg.isNull():
-                pm = QPixmap.fromImage(qimg)
-                return pm.scaled(THUMB_MAX_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                if qimg.width() > THUMB_MAX_SIZE.width() or qimg.height() > THUMB_MAX_SIZE.height():
+                    # Reader couldn't report a size up front; shrink now.
+                    qimg = qimg.scaled(THUMB_MAX_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+                return qimg
         except Exception:
             pass
-        # Fallback to QPixmap loader
-        pm = QPixmap(page_data.path)
-        if not pm.isNull():
-            return pm.scaled(THUMB_MAX_SIZE, Qt.AspectRatioMode.KeepAspectRatio, Qt.TransformationMode.SmoothTransformation)
+        # Fallback to PIL for formats Qt can't read
         try:
             img = Image.open(page_data.path)
             img = _prepare_image_for_thumb(img)
-            qim = ImageQt(img)
-            return QPixmap.fromImage(qim)
+            return pil_to_qimage(img)
         except Exception:
-            return _broken_pixmap()
+            return QImage()
     else:
         # PDF page
-        try:
-            pdf = pdfium.PdfDocument(page_data.path)
-            page = pdf.get_page(page_data.page_index or 0)
-            # Determine scale based on desired thumb max size
-            width, height = page.get_size()
-            scale = min(THUMB_MAX_SIZE.width() / max(width, 1), THUMB_MAX_SIZE.height() / max(height, 1))
-            scale = max(scale, 0.2)
-            bitmap = page.render(scale=scale * 2.0)  # render at 2x for sharper thumbnail
-            pil_img = bitmap.to_pil()
-            page.close()
-            pil_img = _prepare_image_for_thumb(pil_img)
-            qim = ImageQt(pil_img)
-            pm = QPixmap.fromImage(qim)
-            pdf.close()
-            return pm
-        except Exception:
-            return _broken_pixmap()
+        with _PDFIUM_LOCK:
+            try:
+                pdf = pdfium.PdfDocument(page_data.path)
+            except Exception:
+                return QImage()
+            try:
+                return _render_pdf_page(pdf, page_data.page_index or 0)
+            finally:
+                pdf.close()
+
+
+def pil_to_qimage(img: Image.Image) -> QImage:
+    """Convert a PIL image to QImage with a single pixel-buffer copy.
+
+    QImage wraps the bytes from tobytes() directly; the trailing .copy()
+    detaches it from the Python buffer, which is one memcpy total versus
+    ImageQt's convert-then-QPixmap double copy.
+    """
+    if img.mode == "RGB":
+        fmt = QImage.Format.Format_RGB888
+        bytes_per_pixel = 3
+    elif img.mode == "L":
+        fmt = QImage.Format.Format_Grayscale8
+        bytes_per_pixel = 1
+    else:
+        if img.mode != "RGBA":
+            img = img.convert("RGBA")
+        fmt = QImage.Format.Format_RGBA8888
+        bytes_per_pixel = 4
+    data = img.tobytes("raw", img.mode)
+    return QImage(data, img.width, img.height, img.width * bytes_per_pixel, fmt).copy()
 
 
 def _prepare_image_for_thumb(img: Image.Image) -> Image.Image:
-    # Ensure we have RGB for stable conversion
-    if img.mode not in ("RGB", "RGBA"):
+    # For JPEGs, let libjpeg decode at a reduced DCT scale (1/2, 1/4, 1/8)
+    # close to the target size instead of decoding every block. No-op for
+    # other formats and for already-loaded images.
+    if img.format == "JPEG":
+        img.draft("RGB", (THUMB_MAX_SIZE.width() * 2, THUMB_MAX_SIZE.height() * 2))
+    # Resample in the source mode where Pillow genuinely supports LANCZOS
+    # (L is ~3x cheaper than RGB); for every other mode — notably P and 1,
+    # which Pillow silently resamples with NEAREST — convert up front.
+    if img.mode not in ("RGB", "RGBA", "L", "LA"):
         img = img.convert("RGB")
-    img.thumbnail((THUMB_MAX_SIZE.width(), THUMB_MAX_SIZE.height()), Image.Resampling.LANCZOS)
+    img.thumbnail(
+        (THUMB_MAX_SIZE.width(), THUMB_MAX_SIZE.height()),
+        Image.Resampling.LANCZOS,
+        reducing_gap=2.0,
+    )
     return img
 
 
-def _broken_pixmap() -> QPixmap:
+def _broken_qimage() -> QImage:
+    img = QImage(THUMB_MAX_SIZE, QImage.Format.Format_RGB32)
+    img.fill(Qt.GlobalColor.lightGray)
+    return img
+
+
+def _placeholder_pixmap() -> QPixmap:
     pm = QPixmap(THUMB_MAX_SIZE)
-    pm.fill(Qt.GlobalColor.lightGray)
+    pm.fill(Qt.GlobalColor.gray)
     return pm
 
 
-def image_to_pdf_bytes(path: str) -> bytes:
-    img = Image.open(path)
-    if img.mode in ("P", "LA", "RGBA"):
-        img = img.convert("RGB")
-    buf = io.BytesIO()
-    # Use higher resolution for better quality pages
-    img.save(buf, format="PDF", resolution=300.0)
-    return buf.getvalue()
+# Pages are sized as if the image were scanned at this DPI
+IMAGE_PAGE_DPI = 300.0
+
+_JPEG_SOF_MARKERS = {0xC0, 0xC1, 0xC2, 0xC3, 0xC5, 0xC6, 0xC7, 0xC9, 0xCA, 0xCB, 0xCD, 0xCE, 0xCF}
+
+
+def _jpeg_dimensions(data: bytes) -> Tuple[int, int, int]:
+    """Return (width, height, n_components) from a JPEG's SOF marker."""
+    if data[:2] != b"\xff\xd8":
+        raise ValueError("not a JPEG file")
+    pos = 2
+    while pos + 4 <= len(data):
+        if data[pos] != 0xFF:
+            pos += 1
+            continue
+        marker = data[pos + 1]
+        if marker in (0xD8, 0x01) or 0xD0 <= marker <= 0xD7:
+            pos += 2
+            continue
+        (length,) = struct.unpack(">H", data[pos + 2:pos + 4])
+        if marker in _JPEG_SOF_MARKERS:
+            _, height, width, ncomp = struct.unpack(">BHHB", data[pos + 4:pos + 10])
+            return width, height, ncomp
+        pos += 2 + length
+    raise ValueError("no SOF marker found in JPEG")
+
+
+# (stream bytes, width, height, color space, filter) ready for embedding;
+# picklable, so it can cross a process-pool boundary.
+ImageStreamData = Tuple[bytes, int, int, str, str]
+
+
+def _image_stream_data(path: str) -> ImageStreamData:
+    """The CPU-heavy half of embedding an image: read/decode and encode
+    the XObject stream bytes. Top-level and picklable so a process pool
+    can run it."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext in (".jpg", ".jpeg"):
+        with open(path, "rb") as f:
+            data = f.read()
+        try:
+            width, height, ncomp = _jpeg_dimensions(data)
+        except (ValueError, struct.error):
+            # Not actually a JPEG (misnamed file) or a bitstream the SOF
+            # scanner can't walk; let PIL sniff and decode it below.
+            ncomp = 0
+        # Only gray and RGB JPEGs embed raw: CMYK ones (typically Adobe)
+        # store inverted ink values that need a /Decode array a bare
+        # /DCTDecode XObject doesn't carry, so they fall through to the
+        # decode path below, which normalizes them.
+        if ncomp in (1, 3):
+            color_space = "/DeviceGray" if ncomp == 1 else "/DeviceRGB"
+            return data, width, height, color_space, "/DCTDecode"
+    decoded = Image.open(path)
+    if decoded.mode != "RGB":
+        decoded = decoded.convert("RGB")
+    width, height = decoded.size
+    return zlib.compress(decoded.tobytes()), width, height, "/DeviceRGB", "/FlateDecode"
+
+
+def image_to_pdf_page(writer: pypdf.PdfWriter, path: str,
+                      stream_data: Optional[ImageStreamData] = None) -> None:
+    """Append one page to `writer` containing the image at `path`.
+
+    JPEG bitstreams are embedded untouched under /DCTDecode; other formats
+    are decoded once and stored as raw RGB under /FlateDecode. Either way
+    there is no intermediate single-page PDF to encode and re-parse.
+    Callers that precomputed `_image_stream_data` (e.g. in a process pool)
+    can pass it as `stream_data`.
+    """
+    if stream_data is None:
+        stream_data = _image_stream_data(path)
+    data, width, height, color_space, filter_name = stream_data
+
+    xobj = StreamObject()
+    xobj.update({
+        NameObject("/Type"): NameObject("/XObject"),
+        NameObject("/Subtype"): NameObject("/Image"),
+        NameObject("/Width"): NumberObject(width),
+        NameObject("/Height"): NumberObject(height),
+        NameObject("/ColorSpace"): NameObject(color_space),
+        NameObject("/BitsPerComponent"): NumberObject(8),
+        NameObject("/Filter"): NameObject(filter_name),
+    })
+    xobj._data = data
+    xobj_ref = writer._add_object(xobj)
+
+    page_w = width * 72.0 / IMAGE_PAGE_DPI
+    page_h = height * 72.0 / IMAGE_PAGE_DPI
+    page = writer.add_blank_page(width=page_w, height=page_h)
+    page[NameObject("/Resources")] = DictionaryObject({
+        NameObject("/XObject"): DictionaryObject({NameObject("/Im0"): xobj_ref}),
+    })
+    contents = StreamObject()
+    contents._data = f"q {page_w:.4f} 0 0 {page_h:.4f} 0 0 cm /Im0 Do Q".encode("ascii")
+    page[NameObject("/Contents")] = writer._add_object(contents)
 
 
 def main():
     app = QApplication(sys.argv)
+    app.setApplicationName("PdfCombiner")  # namespaces the thumbnail cache dir
     win = MainWindow()
     win.show()
     sys.exit(app.exec())